@@ -1,11 +1,103 @@
-from flask import Flask, render_template, request, url_for, abort, send_from_directory, jsonify, redirect
+from flask import Flask, render_template, request, url_for, abort, send_from_directory, send_file, jsonify, redirect, Response, stream_with_context, g, has_request_context
+import click
+import functools
+import hashlib
+import io
 import json
 import math
 import os
+import re
+import tempfile
+
+from build_search_index import normalize, searchable_name
+from thumbnails import ThumbnailCache, SIZES, FORMATS, url_key
 
 app = Flask(__name__)
 
 PAGE_SIZE = 30
+CHANGES_PAGE_SIZE = 500
+THUMB_MAX_AGE = 365 * 24 * 60 * 60
+ASSET_MAX_AGE = 365 * 24 * 60 * 60
+ASSET_MANIFEST = "static/dist/manifest.json"
+DATA_DIR = "data/cimanow/ar-series"
+SOURCES = ("deva", "vk")
+QUALITY_PATTERN = re.compile(r"^(best|\d+p)$")
+EXPORT_FORMATS = {
+    "aria2": ("text/plain", "txt"),
+    "m3u": ("audio/x-mpegurl", "m3u")
+}
+
+# The app directory is read-only on Vercel, so cache thumbnails somewhere writable by default
+thumbnail_cache = ThumbnailCache(
+    os.environ.get("THUMB_CACHE_DIR", os.path.join(tempfile.gettempdir(), "egyfilm-thumbs"))
+)
+
+_asset_manifest = {"mtime": None, "manifest": {}}
+_source_digests = {}
+
+def load_asset_manifest():
+    # Written by build_assets.py; reload only when a new build lands
+    try:
+        mtime = os.path.getmtime(ASSET_MANIFEST)
+    except OSError:
+        return {}
+    if _asset_manifest["mtime"] != mtime:
+        with open(ASSET_MANIFEST, "r", encoding="utf-8") as f:
+            _asset_manifest["manifest"] = json.load(f)
+        _asset_manifest["mtime"] = mtime
+    return _asset_manifest["manifest"]
+
+def get_file_digest(full_path):
+    # Hashed once per mtime change, so a render costs a stat per file
+    try:
+        mtime = os.path.getmtime(full_path)
+    except OSError:
+        return None
+    cached = _source_digests.get(full_path)
+    if cached is None or cached[0] != mtime:
+        with open(full_path, "rb") as f:
+            cached = (mtime, hashlib.md5(f.read()).hexdigest())
+        _source_digests[full_path] = cached
+    return cached[1]
+
+def get_source_digest(path):
+    return get_file_digest(os.path.join(app.static_folder, path))
+
+def purge_inputs_changed(manifest):
+    # The CSS purge only kept rules for names found in the templates and scripts it scanned,
+    # so a new template or an edit to one may need a rule the built CSS dropped
+    recorded = manifest.get("purge_inputs", {})
+    template_dir = os.path.join(app.root_path, app.template_folder)
+    templates = {f"templates/{name}" for name in os.listdir(template_dir) if name.endswith(".html")}
+    if not templates <= set(recorded):
+        return True
+    return any(
+        get_file_digest(os.path.join(app.root_path, *path.split("/"))) != digest
+        for path, digest in recorded.items()
+    )
+
+@app.context_processor
+def inject_asset():
+    def asset(path):
+        manifest = load_asset_manifest()
+        hashed = manifest.get("assets", {}).get(path)
+        if hashed and manifest.get("sources", {}).get(path) != get_source_digest(path):
+            app.logger.warning(f"{path} changed since the last build_assets.py run, serving it unbuilt")
+            hashed = None
+        if hashed and path.endswith(".css") and purge_inputs_changed(manifest):
+            app.logger.warning(f"Templates or scripts changed since the last build_assets.py run, serving {path} unbuilt")
+            hashed = None
+        return url_for("static", filename=hashed or path)
+    return {"asset": asset}
+
+@app.after_request
+def cache_fingerprinted_assets(response):
+    # Built assets and search shards have their content hash in the name,
+    # so they never need revalidating
+    fingerprinted = request.path.startswith(("/static/dist/", "/static/search/s-"))
+    if fingerprinted and response.status_code == 200:
+        response.headers["Cache-Control"] = f"public, max-age={ASSET_MAX_AGE}, immutable"
+    return response
 
 def get_pagination(page, total_pages):
     pagination = []
@@ -41,8 +133,52 @@ def get_pagination(page, total_pages):
         
     return pagination
 
-def load_series_qualities(series_id):
-    series_dir = os.path.join("data/cimanow/ar-series/ids", str(series_id))
+def sort_quality(q):
+    # Convert quality string to numeric value for sorting
+    try:
+        return int(''.join(filter(str.isdigit, q)))
+    except:
+        return 0
+
+def get_snapshot_id():
+    # ep_op.py swaps CURRENT atomically once a snapshot is complete
+    try:
+        with open(os.path.join(DATA_DIR, "CURRENT"), "r", encoding="utf-8") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+@app.before_request
+def pin_snapshot():
+    # Resolve CURRENT once so every lookup in a request reads the same snapshot
+    g.snapshot_id = get_snapshot_id()
+
+def current_snapshot_id():
+    if has_request_context() and "snapshot_id" in g:
+        return g.snapshot_id
+    return get_snapshot_id()
+
+def get_data_dir(snapshot_id):
+    if snapshot_id is None:
+        # Data published before snapshots existed lives directly in DATA_DIR
+        return DATA_DIR
+    return os.path.join(DATA_DIR, "snapshots", snapshot_id)
+
+def snapshot_cached(func):
+    cached = functools.lru_cache(maxsize=2048)(func)
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        snapshot_id = current_snapshot_id()
+        if snapshot_id is None:
+            # Legacy data is rewritten in place, so it can't be cached
+            return func(None, *args)
+        return cached(snapshot_id, *args)
+    return wrapper
+
+@snapshot_cached
+def load_series_qualities(snapshot_id, series_id):
+    series_dir = os.path.join(get_data_dir(snapshot_id), "ids", str(series_id))
     if not os.path.exists(series_dir):
         return None
     
@@ -66,14 +202,94 @@ def load_series_qualities(series_id):
     return qualities if qualities["qualities"] else None
 
 
-def load_quality_links(series_id, source, quality):
-    quality_file = os.path.join("data/cimanow/ar-series/ids", str(series_id), f"{source}_{quality}.json")
+@snapshot_cached
+def load_quality_links(snapshot_id, series_id, source, quality):
+    quality_file = os.path.join(get_data_dir(snapshot_id), "ids", str(series_id), f"{source}_{quality}.json")
     if not os.path.exists(quality_file):
         return None
         
     with open(quality_file, "r", encoding="utf-8") as f:
         return json.load(f)
 
+@snapshot_cached
+def load_changes(snapshot_id):
+    changes_file = os.path.join(get_data_dir(snapshot_id), "changes.json")
+    if not os.path.exists(changes_file):
+        return {"last_seq": 0, "versions": {}, "changes": []}
+
+    with open(changes_file, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def get_series_version(series_id):
+    return load_changes().get("versions", {}).get(str(series_id), 0)
+
+def get_series_ids():
+    with open(os.path.join(DATA_DIR, "ar-series.json"), "r", encoding="utf-8") as f:
+        return [str(s.get("id", "")) for s in json.load(f)]
+
+def safe_filename(name):
+    return "".join(c for c in name if c not in '<>:"/\\|?*').strip() or "series"
+
+def iter_export(series_ids, source, quality, fmt):
+    """Yield an aria2c input file or M3U playlist one episode at a time.
+
+    Pass quality="best" to take the highest quality each series has for source.
+    """
+    # Pin one snapshot so a publish mid-stream can't mix two versions
+    ids_dir = os.path.join(get_data_dir(current_snapshot_id()), "ids")
+
+    if fmt == "m3u":
+        yield "#EXTM3U\n"
+
+    for series_id in series_ids:
+        series_dir = os.path.join(ids_dir, str(series_id))
+        if not os.path.isdir(series_dir):
+            continue
+
+        series_quality = quality
+        if quality == "best":
+            available = [f[len(source) + 1:-5] for f in os.listdir(series_dir)
+                         if f.startswith(f"{source}_") and f.endswith(".json")]
+            if not available:
+                continue
+            series_quality = max(available, key=sort_quality)
+
+        quality_file = os.path.join(series_dir, f"{source}_{series_quality}.json")
+        if not os.path.exists(quality_file):
+            continue
+
+        # Only one series' links are held in memory at a time
+        with open(quality_file, "r", encoding="utf-8") as f:
+            quality_content = json.load(f)
+
+        title = quality_content.get("title", str(series_id))
+        for ep in quality_content.get("episodes", []):
+            if fmt == "m3u":
+                yield f"#EXTINF:-1,{title} - {ep['name']}\n{ep['url']}\n"
+            else:
+                ext = os.path.splitext(ep["url"].split("?")[0])[1] or ".mp4"
+                out = safe_filename(f"{title} {ep['name']}") + ext
+                yield f"{ep['url']}\n  dir={safe_filename(title)}\n  out={out}\n"
+
+_image_urls = {"mtime": None, "urls": {}}
+
+def get_image_urls():
+    # Only posters from the catalog can be thumbnailed, so the route can't be used as an open proxy.
+    # Rebuilt only when ar-series.json changes, not on every thumbnail request
+    series_file = os.path.join(DATA_DIR, "ar-series.json")
+    mtime = os.path.getmtime(series_file)
+    if _image_urls["mtime"] != mtime:
+        with open(series_file, "r", encoding="utf-8") as f:
+            series_list = json.load(f)
+        _image_urls["urls"] = {url_key(s["image"]): s["image"] for s in series_list if s.get("image")}
+        _image_urls["mtime"] = mtime
+    return _image_urls["urls"]
+
+def get_thumbnail_url(image, size, fmt):
+    if not image:
+        return ""
+    return url_for("thumbnail", size=size, key=url_key(image), fmt=fmt)
+
 def get_series_data():
     with open("data/cimanow/ar-series/ar-series.json", "r", encoding="utf-8") as f:
         series_list = json.load(f)
@@ -88,6 +304,8 @@ def get_series_data():
             "genres": [g.strip() for g in s.get("genre", "").split("،") if g.strip()],
             "categories": s.get("season", ""),
             "image": s.get("image", ""),
+            "thumb_webp": get_thumbnail_url(s.get("image", ""), "md", "webp"),
+            "thumb_jpg": get_thumbnail_url(s.get("image", ""), "md", "jpg"),
             "link": url_for("download", series_id=s.get("id", ""))
         })
     return series_data
@@ -103,13 +321,12 @@ def search():
         return jsonify({"results": []})
     
     series_data = get_series_data()
-    query_lower = query.lower()
+    normalized = normalize(query)
     
-    # Search in titles
+    # Search in titles, folded the same way as the local index so the dropdown and this page agree
     results = [
         s for s in series_data 
-        if query_lower in s["title"].lower() or 
-           query_lower in s["title_ar"].lower()
+        if normalized in normalize(f"{s['title_ar']} {searchable_name(s['title'])}")
     ]
     
     if view == "page":
@@ -135,6 +352,70 @@ def search():
     # Return JSON results for live search
     return jsonify({"results": results[:10]})  # Limit to 10 results for dropdown
 
+@app.route("/api/changes")
+def changes():
+    # type=int would quietly fall back to the default, replaying the whole feed for a broken cursor
+    try:
+        since = int(request.args.get("since", 0))
+        limit = int(request.args.get("limit", CHANGES_PAGE_SIZE))
+    except ValueError:
+        abort(400)
+    if limit < 1:
+        abort(400)
+    limit = min(limit, CHANGES_PAGE_SIZE)
+
+    changes_data = load_changes()
+    pending = [c for c in changes_data["changes"] if c["seq"] > since]
+    page = pending[:limit]
+
+    # Cursor is the last seq handed out, so clients resume from where they stopped
+    cursor = page[-1]["seq"] if page else max(since, changes_data["last_seq"])
+
+    return jsonify({
+        "cursor": cursor,
+        "has_more": len(pending) > len(page),
+        "changes": page
+    })
+
+@app.route("/api/export")
+def export():
+    source = request.args.get("source", "deva")
+    quality = request.args.get("quality", "best")
+    fmt = request.args.get("format", "aria2")
+    ids = request.args.get("ids", "").strip()
+
+    # quality ends up in a file path and in Content-Disposition, so only allow known shapes
+    if source not in SOURCES or fmt not in EXPORT_FORMATS or not QUALITY_PATTERN.match(quality):
+        abort(400)
+
+    if ids:
+        series_ids = [i.strip() for i in ids.split(",") if i.strip()]
+        if not all(i.isdigit() for i in series_ids):
+            abort(400)
+    else:
+        series_ids = get_series_ids()
+
+    mimetype, ext = EXPORT_FORMATS[fmt]
+    response = Response(stream_with_context(iter_export(series_ids, source, quality, fmt)), mimetype=mimetype)
+    response.headers["Content-Disposition"] = f"attachment; filename=egyfilm-{source}-{quality}.{ext}"
+    return response
+
+def validate_quality(ctx, param, value):
+    if not QUALITY_PATTERN.match(value):
+        raise click.BadParameter("expected 'best' or a quality like 720p")
+    return value
+
+@app.cli.command("export")
+@click.argument("series_ids", nargs=-1)
+@click.option("--source", default="deva", type=click.Choice(SOURCES))
+@click.option("--quality", default="best", callback=validate_quality, help="e.g. 720p, or best for the highest available")
+@click.option("--format", "fmt", default="aria2", type=click.Choice(list(EXPORT_FORMATS)))
+@click.option("--output", "-o", type=click.File("w", encoding="utf-8"), default="-")
+def export_command(series_ids, source, quality, fmt, output):
+    """Write download lists for SERIES_IDS (all series if none given)."""
+    for line in iter_export(series_ids or get_series_ids(), source, quality, fmt):
+        output.write(line)
+
 @app.route("/")
 def series():
     page = int(request.args.get("page", 1))
@@ -189,16 +470,12 @@ def download(series_id):
     if not qualities_info:
         abort(404)
         
+    # Version changes whenever new episodes land, so links can be cached per version
+    version = get_series_version(series_id)
+
     # Prepare JSON file links
     json_links = []
     
-    def sort_quality(q):
-        # Convert quality string to numeric value for sorting
-        try:
-            return int(''.join(filter(str.isdigit, q)))
-        except:
-            return 0
-            
     # Add Deva (EgyFilm) JSON links first
     if "deva" in qualities_info["qualities"]:
         sorted_qualities = sorted(qualities_info["qualities"]["deva"], key=sort_quality, reverse=True)
@@ -206,7 +483,7 @@ def download(series_id):
             json_links.append({
                 "server": "EgyFilm",
                 "quality": quality,
-                "url": f"/data/cimanow/ar-series/ids/{series_id}/deva_{quality}.json"
+                "url": f"/data/cimanow/ar-series/ids/{series_id}/deva_{quality}.json?v={version}"
             })
                     
     # Add VK JSON links second
@@ -216,7 +493,7 @@ def download(series_id):
             json_links.append({
                 "server": "VK.com",
                 "quality": quality,
-                "url": f"/data/cimanow/ar-series/ids/{series_id}/vk_{quality}.json"
+                "url": f"/data/cimanow/ar-series/ids/{series_id}/vk_{quality}.json?v={version}"
             })
     
 
@@ -225,6 +502,7 @@ def download(series_id):
         "download.html",
         series={
             "id": series_id,
+            "version": version,
             "title": series.get("title_ar", ""),
             "download_links": json_links,
             "description": series.get("genre", ""),
@@ -235,9 +513,30 @@ def download(series_id):
 # Serve static JSON files
 @app.route('/data/cimanow/ar-series/ids/<series_id>/<filename>')
 def serve_json(series_id, filename):
-    directory = f"data/cimanow/ar-series/ids/{series_id}"
+    directory = os.path.join(get_data_dir(current_snapshot_id()), "ids", series_id)
     return send_from_directory(directory, filename, as_attachment=True)
 
+@app.route("/thumbs/<size>/<key>.<fmt>")
+def thumbnail(size, key, fmt):
+    if size not in SIZES or fmt not in FORMATS:
+        abort(404)
+
+    image_url = get_image_urls().get(key)
+    if not image_url:
+        abort(404)
+
+    try:
+        data = thumbnail_cache.get(image_url, size, fmt)
+    except Exception as e:
+        # Fall back to hotlinking the original rather than showing a broken poster
+        app.logger.warning(f"Thumbnail generation failed for {image_url}: {e}")
+        return redirect(image_url)
+
+    # Keys are derived from the poster URL, so a given thumbnail URL never changes content
+    response = send_file(io.BytesIO(data), mimetype=FORMATS[fmt][1], max_age=THUMB_MAX_AGE)
+    response.headers["Cache-Control"] = f"public, max-age={THUMB_MAX_AGE}, immutable"
+    return response
+
 # Allow serving static files in debug mode
 app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 0
 
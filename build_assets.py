@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+"""Build purged, minified, content-hashed copies of the template assets into static/dist.
+
+Run after changing anything under static/css, static/js, static/fonts or the
+templates (pip install -r requirements-build.txt first):
+
+    python build_assets.py
+
+The manifest records a digest of each source file, and of the templates and
+scripts the CSS purge scanned; app.py serves the plain, unbuilt file for any
+asset whose source no longer matches (and for the stylesheets when a purge
+input changed), so edits show up before the next build, just without the
+immutable caching.
+"""
+import glob
+import hashlib
+import io
+import json
+import os
+import posixpath
+import re
+import shutil
+
+try:
+    from fontTools import subset as font_subset
+except ImportError:
+    font_subset = None
+
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
+STATIC_DIR = "static"
+TEMPLATES_DIR = "templates"
+SERIES_FILE = "data/cimanow/ar-series/ar-series.json"
+DIST_DIR = "dist"
+MANIFEST_FILE = os.path.join(STATIC_DIR, DIST_DIR, "manifest.json")
+
+ASSET_CALL = re.compile(r"""asset\(\s*['"]([^'"]+)['"]\s*\)""")
+CSS_URL = re.compile(r"""url\(\s*(['"]?)([^'")]+)\1\s*\)""")
+CSS_ESCAPE = re.compile(r"\\([0-9a-fA-F]{1,6})")
+SELECTOR_NAMES = re.compile(r"[.#](-?[_a-zA-Z][\w-]*)")
+TOKEN = re.compile(r"[\w-]+")
+
+# Glyphs kept in text fonts on top of what the templates and catalog actually use
+TEXT_FONT_RANGES = [(0x20, 0x7E), (0x0600, 0x06FF)]
+
+# ---------------------------------------------------------------------------
+# CSS parsing
+# ---------------------------------------------------------------------------
+
+def split_css(css):
+    """Split a stylesheet into top level (prelude, body) pairs, body is None for statements."""
+    items = []
+    depth = 0
+    start = 0
+    prelude = ""
+    i = 0
+    while i < len(css):
+        c = css[i]
+        if c in "\"'":
+            end = css.find(c, i + 1)
+            while end != -1 and css[end - 1] == "\\":
+                end = css.find(c, end + 1)
+            i = len(css) if end == -1 else end + 1
+            continue
+        if c == "/" and css.startswith("/*", i):
+            end = css.find("*/", i + 2)
+            i = len(css) if end == -1 else end + 2
+            continue
+        if c == "{":
+            if depth == 0:
+                prelude = css[start:i]
+                start = i + 1
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                items.append((prelude.strip(), css[start:i]))
+                start = i + 1
+        elif c == ";" and depth == 0:
+            items.append((css[start:i].strip(), None))
+            start = i + 1
+        i += 1
+    return items
+
+def strip_comments(css):
+    # Drops everything but "/*!" license headers, which are collected separately
+    licenses = re.findall(r"/\*!.*?\*/", css, re.S)
+    return licenses, re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+
+def minify_selector(selector):
+    selector = " ".join(selector.split())
+    return re.sub(r"\s*([,>{}])\s*", r"\1", selector)
+
+def minify_declarations(body):
+    body = " ".join(body.split())
+    body = re.sub(r"\s*;\s*", ";", body)
+    body = re.sub(r"\s*:\s*", ":", body)
+    return body.rstrip(";")
+
+def selector_used(selector, used):
+    return all(name in used for name in SELECTOR_NAMES.findall(selector))
+
+def purge_css(css, used):
+    """Drop rules whose selectors reference classes or ids never seen in templates or scripts."""
+    out = []
+    for prelude, body in split_css(css):
+        if body is None:
+            if prelude:
+                out.append(prelude + ";")
+        elif prelude.startswith("@media") or prelude.startswith("@supports"):
+            inner = purge_css(body, used)
+            if inner:
+                out.append(f"{minify_selector(prelude)}{{{inner}}}")
+        elif prelude.startswith("@") and "keyframes" in prelude:
+            frames = "".join(
+                f"{minify_selector(p)}{{{minify_declarations(b)}}}"
+                for p, b in split_css(body) if b is not None
+            )
+            out.append(f"{minify_selector(prelude)}{{{frames}}}")
+        elif prelude.startswith("@"):
+            out.append(f"{minify_selector(prelude)}{{{minify_declarations(body)}}}")
+        else:
+            selectors = [s for s in prelude.split(",") if selector_used(s, used)]
+            declarations = minify_declarations(body)
+            if selectors and declarations:
+                out.append(f"{minify_selector(','.join(selectors))}{{{declarations}}}")
+    return "".join(out)
+
+def drop_unused_font_faces(css):
+    """Remove @font-face blocks whose family is no longer referenced by any kept rule."""
+    faces = re.findall(r"@font-face\{[^}]*\}", css)
+    rest = re.sub(r"@font-face\{[^}]*\}", "", css)
+    for face in faces:
+        family = re.search(r"font-family:\s*(['\"]?)([^;'\"}]+)\1", face)
+        if family and family.group(2) not in rest:
+            css = css.replace(face, "", 1)
+    return css
+
+# ---------------------------------------------------------------------------
+# Asset pipeline
+# ---------------------------------------------------------------------------
+
+def fingerprint(rel_path, data):
+    digest = hashlib.md5(data).hexdigest()[:10]
+    stem, ext = posixpath.splitext(rel_path)
+    return posixpath.join(DIST_DIR, f"{stem}.{digest}{ext}")
+
+def write_asset(manifest, rel_path, data):
+    hashed = fingerprint(rel_path, data)
+    out_path = os.path.join(STATIC_DIR, *hashed.split("/"))
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    with open(out_path, "wb") as f:
+        f.write(data)
+    manifest[rel_path] = hashed
+
+def read_static(rel_path):
+    with open(os.path.join(STATIC_DIR, *rel_path.split("/")), "rb") as f:
+        return f.read()
+
+def resolve_url(css_path, url):
+    """Map a url() reference to a static-relative path, or None for external/data URLs."""
+    if url.startswith(("data:", "http:", "https:", "//", "#")):
+        return None
+    url = url.split("?")[0].split("#")[0]
+    if url.startswith("/static/"):
+        return url[len("/static/"):]
+    if url.startswith("/"):
+        return None
+    return posixpath.normpath(posixpath.join(posixpath.dirname(css_path), url))
+
+def find_entry_points():
+    entries = set()
+    for path in glob.glob(os.path.join(TEMPLATES_DIR, "*.html")):
+        with open(path, "r", encoding="utf-8") as f:
+            entries.update(ASSET_CALL.findall(f.read()))
+    return sorted(entries)
+
+def purge_input_paths(entries):
+    """Return the project-relative paths of the templates and scripts scanned for used names."""
+    paths = [path.replace(os.sep, "/") for path in sorted(glob.glob(os.path.join(TEMPLATES_DIR, "*.html")))]
+    paths += [posixpath.join(STATIC_DIR, rel_path) for rel_path in entries if rel_path.endswith(".js")]
+    return paths
+
+def read_project_file(path):
+    with open(os.path.join(*path.split("/")), "rb") as f:
+        return f.read()
+
+def collect_used_names(entries):
+    # Anything that looks like an identifier in templates or shipped scripts counts as used,
+    # which keeps classes toggled from JavaScript
+    text = [read_project_file(path).decode("utf-8", "ignore") for path in purge_input_paths(entries)]
+    return set(TOKEN.findall("\n".join(text)))
+
+def collect_text_codepoints():
+    codepoints = set()
+    for start, end in TEXT_FONT_RANGES:
+        codepoints.update(range(start, end + 1))
+    sources = glob.glob(os.path.join(TEMPLATES_DIR, "*.html")) + [SERIES_FILE]
+    for path in sources:
+        with open(path, "r", encoding="utf-8") as f:
+            codepoints.update(ord(c) for c in f.read())
+    return codepoints
+
+def subset_font(data, rel_path, codepoints):
+    if font_subset is None:
+        return data
+
+    stem, ext = posixpath.splitext(rel_path)
+    options = font_subset.Options()
+    options.layout_features = ["*"]
+    options.flavor = {".woff2": "woff2", ".woff": "woff"}.get(ext)
+    options.notdef_outline = True
+
+    sources = [data]
+    # Some shipped woff2 files don't decode, the matching ttf carries the same glyphs
+    if ext != ".ttf" and os.path.exists(os.path.join(STATIC_DIR, *f"{stem}.ttf".split("/"))):
+        sources.append(read_static(f"{stem}.ttf"))
+
+    error = None
+    for source in sources:
+        try:
+            font = font_subset.load_font(io.BytesIO(source), options)
+            subsetter = font_subset.Subsetter(options)
+            subsetter.populate(unicodes=codepoints)
+            subsetter.subset(font)
+            out = io.BytesIO()
+            font_subset.save_font(font, out, options)
+            return out.getvalue()
+        except Exception as e:
+            error = e
+    print(f"Keeping {rel_path} unsubsetted: {error}")
+    return data
+
+def main():
+    shutil.rmtree(os.path.join(STATIC_DIR, DIST_DIR), ignore_errors=True)
+    if font_subset is None:
+        print("fontTools not installed, fonts will be copied without subsetting")
+    if rjsmin is None:
+        print("rjsmin not installed, scripts will be copied without minifying")
+
+    entries = find_entry_points()
+    used = collect_used_names(entries)
+    manifest = {}
+
+    # Purge stylesheets first so fonts can be subset to the icons that survive
+    purged = {}
+    licenses = {}
+    for rel_path in entries:
+        if rel_path.endswith(".css"):
+            license_headers, css = strip_comments(read_static(rel_path).decode("utf-8"))
+            licenses[rel_path] = license_headers
+            purged[rel_path] = drop_unused_font_faces(purge_css(css, used))
+
+    icon_codepoints = set()
+    for css in purged.values():
+        icon_codepoints.update(int(h, 16) for h in CSS_ESCAPE.findall(css))
+    text_codepoints = collect_text_codepoints()
+
+    # Fonts and images referenced from CSS or templates
+    dependencies = set(e for e in entries if not e.endswith((".css", ".js")))
+    for rel_path, css in purged.items():
+        for _, url in CSS_URL.findall(css):
+            dep = resolve_url(rel_path, url)
+            if dep and os.path.exists(os.path.join(STATIC_DIR, *dep.split("/"))):
+                dependencies.add(dep)
+
+    for rel_path in sorted(dependencies):
+        data = read_static(rel_path)
+        if rel_path.startswith("fonts/"):
+            name = posixpath.basename(rel_path)
+            codepoints = icon_codepoints if name.startswith("fa-") else text_codepoints
+            data = subset_font(data, rel_path, codepoints)
+        write_asset(manifest, rel_path, data)
+
+    for rel_path, css in purged.items():
+        def rewrite(match, rel_path=rel_path):
+            dep = resolve_url(rel_path, match.group(2))
+            if dep in manifest:
+                return f"url(/static/{manifest[dep]})"
+            return match.group(0)
+        css = "\n".join(licenses[rel_path] + [CSS_URL.sub(rewrite, css)])
+        write_asset(manifest, rel_path, css.encode("utf-8"))
+
+    for rel_path in entries:
+        if rel_path.endswith(".js"):
+            data = read_static(rel_path)
+            if rjsmin is not None and not rel_path.endswith(".min.js"):
+                data = rjsmin.jsmin(data.decode("utf-8")).encode("utf-8")
+            write_asset(manifest, rel_path, data)
+
+    # Digests of the sources let the app notice edits made since this build
+    sources = {rel_path: hashlib.md5(read_static(rel_path)).hexdigest() for rel_path in manifest}
+    purge_inputs = {path: hashlib.md5(read_project_file(path)).hexdigest() for path in purge_input_paths(entries)}
+    with open(MANIFEST_FILE, "w", encoding="utf-8") as f:
+        json.dump(
+            {"assets": manifest, "sources": sources, "purge_inputs": purge_inputs},
+            f, ensure_ascii=False, indent=2, sort_keys=True
+        )
+
+    for rel_path, hashed in sorted(manifest.items()):
+        before = os.path.getsize(os.path.join(STATIC_DIR, *rel_path.split("/")))
+        after = os.path.getsize(os.path.join(STATIC_DIR, *hashed.split("/")))
+        print(f"{rel_path}: {before} -> {after} bytes ({hashed})")
+
+if __name__ == "__main__":
+    main()
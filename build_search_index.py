@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import json
+import os
+import re
+
+SERIES_FILE = "data/cimanow/ar-series/ar-series.json"
+OUTPUT_DIR = "static/search"
+
+# Keep in sync with normalizeSearch() in templates/header.html
+TASHKEEL = re.compile(r"[\u064B-\u0652\u0640]")
+AR_NORMALIZE = str.maketrans({
+    "أ": "ا", "إ": "ا", "آ": "ا", "ة": "ه", "ى": "ي", "ؤ": "و", "ئ": "ي"
+})
+
+def normalize(text):
+    text = TASHKEEL.sub("", str(text)).translate(AR_NORMALIZE).lower()
+    return " ".join(text.split())
+
+SEASON_TOKEN = re.compile(r"^s\d+$")
+
+def shard_key(token):
+    """Return the shard a title word is indexed under, or None if it isn't worth a key."""
+    # Every romanized name ends with its season, which would put the whole catalog in "s"
+    if SEASON_TOKEN.match(token):
+        return None
+    # Titles mostly start words with the definite article, in Arabic and in Franco,
+    # so shard on what follows it
+    for article in ("ال", "al"):
+        if token.startswith(article) and len(token) > len(article):
+            return token[len(article)]
+    return token[0]
+
+def searchable_name(name):
+    # Drop the "[EgyFilm]" prefix so it doesn't land every series in the "[" shard
+    return re.sub(r"^\[.*?\]\s*", "", name)
+
+def build_index(series_list):
+    shards = {}
+    # Keep catalog order (newest first) so the dropdown matches /search
+    for s in series_list:
+        norm = normalize(f"{s.get('title_ar', '')} {searchable_name(s.get('name', ''))}")
+        entry = [s.get("id", ""), s.get("title_ar", ""), norm, s.get("image", ""), s.get("ribbon", [])]
+        for key in sorted(set(shard_key(t) for t in norm.split()) - {None}):
+            shards.setdefault(key, []).append(entry)
+    return shards
+
+def main():
+    with open(SERIES_FILE, "r", encoding="utf-8") as f:
+        series_list = json.load(f)
+
+    shards = build_index(series_list)
+    payloads = {
+        key: json.dumps(items, ensure_ascii=False, separators=(",", ":"))
+        for key, items in shards.items()
+    }
+
+    # Version changes whenever any shard does, so shard URLs can be cached forever
+    # (app.py serves static/search/s-* as immutable)
+    digest = hashlib.sha1()
+    for key in sorted(payloads):
+        digest.update(key.encode("utf-8"))
+        digest.update(payloads[key].encode("utf-8"))
+    version = digest.hexdigest()[:10]
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    for fname in os.listdir(OUTPUT_DIR):
+        if fname.startswith("s-") and fname.endswith(".json"):
+            os.remove(os.path.join(OUTPUT_DIR, fname))
+
+    manifest = {"version": version, "shards": {}}
+    for key, payload in sorted(payloads.items()):
+        fname = f"s-{version}-{ord(key):04x}.json"
+        with open(os.path.join(OUTPUT_DIR, fname), "w", encoding="utf-8") as f:
+            f.write(payload)
+        manifest["shards"][key] = fname
+
+    with open(os.path.join(OUTPUT_DIR, "index.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, separators=(",", ":"))
+
+    print(f"Wrote {len(payloads)} shards for {len(series_list)} series (version {version})")
+
+if __name__ == "__main__":
+    main()
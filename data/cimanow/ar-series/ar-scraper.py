@@ -35,8 +35,9 @@ def clean_title(title):
     # Remove genre if present in <em>...</em>
     return re.sub(r"<em>.*?</em>", "", title).strip()
 
-def main():
-    base_url = "https://cimanow.cc/category/%D9%85%D8%B3%D9%84%D8%B3%D9%84%D8%A7%D8%AA-%D8%B9%D8%B1%D8%A8%D9%8A%D8%A9/"
+BASE_URL = "https://cimanow.cc/category/%D9%85%D8%B3%D9%84%D8%B3%D9%84%D8%A7%D8%AA-%D8%B9%D8%B1%D8%A8%D9%8A%D8%A9/"
+
+def scrape(base_url=BASE_URL):
     headers = {"User-Agent": "Mozilla/5.0"}
     results = []
     page = 1
@@ -108,6 +109,10 @@ def main():
     for idx, item in enumerate(results):
         item["id"] = total - idx
 
+    return results
+
+def main():
+    results = scrape()
     with open("data/cimanow/ar-series/ar-series.json", "w", encoding="utf-8") as f:
         json.dump(results, f, ensure_ascii=False, indent=2)
 
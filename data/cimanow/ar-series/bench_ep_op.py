@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""End-to-end crawl benchmark against mock_origin.py.
+
+Starts the mock origin in its own process, builds the catalog through
+ar-scraper.py, then runs SeriesDownloader at each concurrency level and
+reports throughput, CPU per episode and whether every expected episode landed.
+"""
+import argparse
+import asyncio
+import importlib.util
+import json
+import logging
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPT_DIR)
+
+from mock_origin import CATEGORY_PATH, MockOrigin
+
+def load_scraper():
+    # ar-scraper.py isn't importable by name because of the dash
+    spec = importlib.util.spec_from_file_location("ar_scraper", os.path.join(SCRIPT_DIR, "ar-scraper.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def start_origin(args, port):
+    cmd = [
+        sys.executable, os.path.join(SCRIPT_DIR, "mock_origin.py"),
+        "--port", str(port),
+        "--series", str(args.series),
+        "--episodes", str(args.episodes),
+        "--latency", str(args.latency),
+        "--error-rate", str(args.error_rate),
+        "--seed", str(args.seed),
+    ]
+    proc = subprocess.Popen(cmd)
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return proc
+        except OSError:
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError("Mock origin did not start")
+
+def verify_crawl(ids_dir, series_list, expected):
+    """Return the number of (series, source, quality, episode) entries missing from the output."""
+    missing = 0
+    for series in series_list:
+        sid = str(series["id"])
+        mock_sid = series["link"].rstrip("/").split("/")[-1]
+        count, qualities = expected[mock_sid]
+        for source in ["deva", "vk"]:
+            for quality in qualities:
+                path = os.path.join(ids_dir, sid, f"{source}_{quality}.json")
+                if not os.path.exists(path):
+                    missing += count
+                    continue
+                with open(path, "r", encoding="utf-8") as f:
+                    found = len(json.load(f)["episodes"])
+                missing += count - found
+    return missing
+
+def run_level(downloader_cls, series_list, concurrency, work_dir):
+    data_dir = os.path.join(work_dir, f"c{concurrency}")
+    os.makedirs(data_dir)
+    with open(os.path.join(data_dir, "ar-series.json"), "w", encoding="utf-8") as f:
+        json.dump(series_list, f, ensure_ascii=False)
+
+    downloader = downloader_cls(data_dir=data_dir, concurrency=concurrency)
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    asyncio.run(downloader.run())
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    episodes = sum(len(s.get("episodes", [])) for s in downloader.processed_data.values())
+    return downloader.published_ids_dir(), episodes, wall, cpu
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ep_op.py against a local mock origin")
+    parser.add_argument("--series", type=int, default=20)
+    parser.add_argument("--episodes", type=int, default=15)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--concurrency", default="1,4,16",
+                        help="comma separated series concurrency levels")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="ep_op_bench_")
+    # ep_op.py opens its log file relative to the working directory at import time
+    os.chdir(work_dir)
+    from ep_op import SeriesDownloader
+    logging.getLogger().setLevel(logging.WARNING)
+
+    port = free_port()
+    proc = start_origin(args, port)
+    try:
+        series_list = load_scraper().scrape(f"http://127.0.0.1:{port}{CATEGORY_PATH}")
+        expected = MockOrigin(args.series, args.episodes, seed=args.seed).expected_episodes()
+        print(f"Catalog: {len(series_list)} series, latency {args.latency}s, error rate {args.error_rate}")
+        print(f"{'concurrency':>11} {'episodes':>9} {'seconds':>8} {'eps/sec':>8} {'cpu ms/ep':>10} {'missing':>8}")
+
+        for level in [int(c) for c in args.concurrency.split(",")]:
+            ids_dir, episodes, wall, cpu = run_level(SeriesDownloader, series_list, level, work_dir)
+            missing = verify_crawl(ids_dir, series_list, expected)
+            print(f"{level:>11} {episodes:>9} {wall:>8.2f} {episodes / wall:>8.1f} "
+                  f"{cpu * 1000 / max(episodes, 1):>10.2f} {missing:>8}")
+    finally:
+        proc.terminate()
+        proc.wait()
+        os.chdir(SCRIPT_DIR)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
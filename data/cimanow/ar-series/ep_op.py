@@ -1,5 +1,6 @@
 import json
 import os
+import shutil
 import asyncio
 import aiohttp
 from bs4 import BeautifulSoup
@@ -17,13 +18,21 @@ logging.basicConfig(
 )
 
 class SeriesDownloader:
-    def __init__(self):
+    def __init__(self, data_dir=None, concurrency=1):
         self.script_dir = os.path.dirname(os.path.abspath(__file__))
-        # Store data files in ar-series directory
-        self.data_dir = self.script_dir
+        # Store data files in ar-series directory unless told otherwise
+        self.data_dir = data_dir or self.script_dir
+        # Number of series crawled at the same time
+        self.concurrency = concurrency
         self.ids_dir = os.path.join(self.data_dir, 'ids')
         self.progress_file = os.path.join(self.data_dir, 'progress.json')
         self.processed_data_file = os.path.join(self.data_dir, 'processed_data.json')
+        self.changes_file = os.path.join(self.data_dir, 'changes.json')
+        # Each run writes a new snapshot under snapshots/ and publishes it through CURRENT
+        self.snapshots_dir = os.path.join(self.data_dir, 'snapshots')
+        self.current_file = os.path.join(self.data_dir, 'CURRENT')
+        self.keep_snapshots = 3
+        self.snapshot_changed = False
         
         # Create ids directory if it doesn't exist
         os.makedirs(self.ids_dir, exist_ok=True)
@@ -31,6 +40,7 @@ class SeriesDownloader:
         self.session = None
         self.progress_data = self.load_progress()
         self.processed_data = self.load_processed_data()
+        self.changes_data = self.load_changes()
         
         # Log progress file locations
         logging.info(f"Using progress file: {self.progress_file}")
@@ -114,6 +124,44 @@ class SeriesDownloader:
         
         return {}
 
+    def load_changes(self):
+        default_changes = {
+            'last_seq': 0,
+            'versions': {},
+            'changes': []
+        }
+        
+        if os.path.exists(self.changes_file):
+            try:
+                with open(self.changes_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                
+                if not isinstance(data, dict):
+                    logging.error("Changes file corrupted, resetting to default")
+                    return default_changes
+                
+                for key in default_changes:
+                    if key not in data:
+                        logging.warning(f"Missing key '{key}' in changes file, repairing")
+                        data[key] = default_changes[key]
+                
+                return data
+                
+            except json.JSONDecodeError:
+                logging.error("Changes file corrupted, trying backup")
+                backup_file = f"{self.changes_file}.backup"
+                if os.path.exists(backup_file):
+                    try:
+                        with open(backup_file, 'r', encoding='utf-8') as f:
+                            return json.load(f)
+                    except:
+                        logging.error("Backup file also corrupted")
+                
+            except Exception as e:
+                logging.error(f"Error loading changes file: {e}")
+        
+        return default_changes
+
     def save_progress(self):
         try:
             # Create backup of existing file
@@ -158,6 +206,131 @@ class SeriesDownloader:
             if os.path.exists(f"{self.processed_data_file}.backup"):
                 os.replace(f"{self.processed_data_file}.backup", self.processed_data_file)
 
+    def save_changes(self):
+        try:
+            # Create backup of existing file
+            if os.path.exists(self.changes_file):
+                backup_file = f"{self.changes_file}.backup"
+                os.replace(self.changes_file, backup_file)
+            
+            # Write new data
+            with open(self.changes_file, 'w', encoding='utf-8') as f:
+                json.dump(self.changes_data, f, ensure_ascii=False, indent=2)
+                
+            # Remove backup if write was successful
+            if os.path.exists(f"{self.changes_file}.backup"):
+                os.remove(f"{self.changes_file}.backup")
+                
+            logging.info("Changes saved successfully")
+        except Exception as e:
+            logging.error(f"Error saving changes: {e}")
+            # Restore backup if write failed
+            if os.path.exists(f"{self.changes_file}.backup"):
+                os.replace(f"{self.changes_file}.backup", self.changes_file)
+
+    def record_changes(self, series_id, added):
+        # added maps (source, quality) -> list of episode numbers added in this run
+        if not added:
+            return
+        
+        version = self.changes_data['versions'].get(series_id, 0) + 1
+        self.changes_data['versions'][series_id] = version
+        timestamp = datetime.now().isoformat()
+        
+        for (source, quality), episodes in sorted(added.items()):
+            self.changes_data['last_seq'] += 1
+            self.changes_data['changes'].append({
+                'seq': self.changes_data['last_seq'],
+                'series_id': series_id,
+                'version': version,
+                'source': source,
+                'quality': quality,
+                'episodes': sorted(episodes, key=lambda x: int(x)),
+                'timestamp': timestamp
+            })
+        
+        # Kept in memory until publish_snapshot, so an interrupted run logs nothing
+        logging.info(f"Recorded changes for series {series_id} (version {version})")
+
+    def write_json(self, path, data):
+        # Replace rather than rewrite in place: files may be hard-linked into published snapshots
+        tmp_file = f"{path}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_file, path)
+
+    def get_current_snapshot(self):
+        if not os.path.exists(self.current_file):
+            return None
+        with open(self.current_file, 'r', encoding='utf-8') as f:
+            return f.read().strip() or None
+
+    def published_ids_dir(self):
+        snapshot_id = self.get_current_snapshot()
+        if snapshot_id is None:
+            # Data published before snapshots existed
+            return os.path.join(self.data_dir, 'ids')
+        return os.path.join(self.snapshots_dir, snapshot_id, 'ids')
+
+    def create_snapshot(self):
+        snapshot_id = datetime.now().strftime('%Y%m%d%H%M%S%f')
+        snapshot_ids_dir = os.path.join(self.snapshots_dir, snapshot_id, 'ids')
+        base_dir = self.published_ids_dir()
+        
+        # Hard-link every published file so unchanged series cost no copies
+        os.makedirs(snapshot_ids_dir, exist_ok=True)
+        if os.path.exists(base_dir):
+            for root, dirs, files in os.walk(base_dir):
+                target_root = os.path.join(snapshot_ids_dir, os.path.relpath(root, base_dir))
+                os.makedirs(target_root, exist_ok=True)
+                for fname in files:
+                    if fname.endswith('.tmp'):
+                        continue
+                    src = os.path.join(root, fname)
+                    dst = os.path.join(target_root, fname)
+                    try:
+                        os.link(src, dst)
+                    except OSError:
+                        shutil.copy2(src, dst)
+        
+        logging.info(f"Created snapshot {snapshot_id} from {base_dir}")
+        return snapshot_id
+
+    def publish_snapshot(self, snapshot_id):
+        snapshot_dir = os.path.join(self.snapshots_dir, snapshot_id)
+        try:
+            # Ship the changes feed with the data it describes; its presence also marks
+            # the snapshot as published for collect_snapshots
+            self.write_json(os.path.join(snapshot_dir, 'changes.json'), self.changes_data)
+            # The run's seqs and version bumps only reach the shared log now, so a crawl
+            # killed before this point doesn't record episodes nobody can read
+            self.save_changes()
+            
+            tmp_file = f"{self.current_file}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(snapshot_id)
+            os.replace(tmp_file, self.current_file)
+            
+            logging.info(f"Published snapshot {snapshot_id}")
+        except Exception as e:
+            logging.error(f"Error publishing snapshot {snapshot_id}: {e}")
+            return
+        
+        self.collect_snapshots(snapshot_id)
+
+    def collect_snapshots(self, current_id):
+        # Keep a few older snapshots around for requests that started before the swap.
+        # Only published ones are candidates: a snapshot without changes.json may belong
+        # to a crawl that is still filling it
+        older = sorted(
+            s for s in os.listdir(self.snapshots_dir)
+            if s < current_id and os.path.exists(os.path.join(self.snapshots_dir, s, 'changes.json'))
+        )
+        stale = older[:max(len(older) - (self.keep_snapshots - 1), 0)]
+        for snapshot_id in stale:
+            shutil.rmtree(os.path.join(self.snapshots_dir, snapshot_id), ignore_errors=True)
+            logging.info(f"Removed old snapshot {snapshot_id}")
+
     def get_series_dir(self, series_id):
         series_dir = os.path.join(self.ids_dir, str(series_id))
         os.makedirs(series_dir, exist_ok=True)
@@ -238,8 +411,8 @@ class SeriesDownloader:
                 
                 quality_content['episodes'].sort(key=lambda x: int(x['name'].split()[-1]))
                 
-                with open(quality_file, 'w', encoding='utf-8') as f:
-                    json.dump(quality_content, f, ensure_ascii=False, indent=2)
+                self.write_json(quality_file, quality_content)
+                self.snapshot_changed = True
                 
                 return True  # New episode was added
             
@@ -249,7 +422,7 @@ class SeriesDownloader:
             logging.error(f"Error saving quality file for episode {ep_num}: {e}")
             return False
 
-    async def process_episode(self, series, ep_num, ep_url, series_dir):
+    async def process_episode(self, series, ep_num, ep_url, series_dir, added=None):
         try:
             quality_links = await self.get_download_links(ep_url)
             
@@ -258,6 +431,8 @@ class SeriesDownloader:
                 for quality, data in links.items():
                     if self.save_quality_file(series, ep_num, source, quality, data, series_dir):
                         new_content_added = True
+                        if added is not None:
+                            added.setdefault((source, quality), []).append(ep_num)
             
             return new_content_added
             
@@ -267,7 +442,11 @@ class SeriesDownloader:
 
     def create_series_summary(self, series, series_dir):
         try:
-            summary = {'title': series['name'], 'qualities': {}}
+            summary = {
+                'title': series['name'],
+                'version': self.changes_data['versions'].get(str(series['id']), 0),
+                'qualities': {}
+            }
             for source in ['vk', 'deva']:
                 for quality_file in os.listdir(series_dir):
                     if quality_file.startswith(f'{source}_') and quality_file.endswith('.json'):
@@ -276,8 +455,7 @@ class SeriesDownloader:
                             summary['qualities'][source] = {}
                         summary['qualities'][source][quality] = quality_file
 
-            with open(os.path.join(series_dir, 'summary.json'), 'w', encoding='utf-8') as f:
-                json.dump(summary, f, ensure_ascii=False, indent=2)
+            self.write_json(os.path.join(series_dir, 'summary.json'), summary)
                 
         except Exception as e:
             logging.error(f"Error creating summary for {series['name']}: {e}")
@@ -359,11 +537,14 @@ class SeriesDownloader:
             if new_episodes:
                 logging.info(f"Found {len(new_episodes)} episodes to process for {series['name']}")
                 
+                # Track what this run adds for the changes feed
+                added = {}
+                
                 # Process episodes sequentially
                 for ep_num, ep_url in new_episodes:
                     try:
                         logging.info(f"Processing episode {ep_num}")
-                        new_content = await self.process_episode(series, ep_num, ep_url, series_dir)
+                        new_content = await self.process_episode(series, ep_num, ep_url, series_dir, added)
                         
                         if new_content:
                             # Update processed data
@@ -386,6 +567,9 @@ class SeriesDownloader:
                         logging.error(f"Error processing episode {ep_num}: {e}")
                         continue
                 
+                # Bump series version and log the change before writing the summary
+                self.record_changes(series_id, added)
+                
                 # Update series summary
                 self.create_series_summary(series, series_dir)
                 
@@ -413,7 +597,7 @@ class SeriesDownloader:
 
     async def run(self):
         # Load series list
-        series_file = os.path.join(self.script_dir, 'ar-series.json')
+        series_file = os.path.join(self.data_dir, 'ar-series.json')
         try:
             with open(series_file, 'r', encoding='utf-8') as f:
                 series_list = json.load(f)
@@ -421,17 +605,30 @@ class SeriesDownloader:
             logging.error(f"Error loading series list: {e}")
             return
 
-        # Create ids directory if it doesn't exist
-        os.makedirs(self.ids_dir, exist_ok=True)
+        # Work on a private copy so readers only ever see a complete, published snapshot
+        snapshot_id = self.create_snapshot()
+        self.ids_dir = os.path.join(self.snapshots_dir, snapshot_id, 'ids')
+        self.snapshot_changed = False
 
         # Process series with limited concurrency
         connector = aiohttp.TCPConnector(limit=50)
         async with aiohttp.ClientSession(connector=connector) as session:
             self.session = session
             
-            # Process series one at a time to avoid overwhelming the server
-            for series in series_list:
-                await self.process_series(series)
+            # Process series one at a time by default to avoid overwhelming the server
+            semaphore = asyncio.Semaphore(self.concurrency)
+            
+            async def process_limited(series):
+                async with semaphore:
+                    await self.process_series(series)
+            
+            await asyncio.gather(*(process_limited(series) for series in series_list))
+
+        if self.snapshot_changed:
+            self.publish_snapshot(snapshot_id)
+        else:
+            logging.info("No new episodes, discarding snapshot")
+            shutil.rmtree(os.path.join(self.snapshots_dir, snapshot_id), ignore_errors=True)
 
 def main():
     downloader = SeriesDownloader()
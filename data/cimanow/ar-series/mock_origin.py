@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""Local stand-in for cimanow.cc so the scrapers can be run and benchmarked offline.
+
+Serves the same markup ar-scraper.py and ep_op.py parse: paginated category
+pages, series pages with the episode list and watching pages with the quality
+boxes. Catalog contents are generated from a seed, so runs are reproducible.
+"""
+import argparse
+import asyncio
+import random
+
+from aiohttp import web
+
+CATEGORY_PATH = "/category/arabic-series/"
+QUALITIES = ["1080p", "720p", "480p", "360p"]
+TITLE_WORDS = [
+    "الشمس", "الحرير", "مملكة", "بريستيج", "الوحوش", "جريا", "حكيم", "باشا", "الناس",
+    "أخواتي", "القاهرة", "الليل", "البحر", "العائلة", "الطريق", "الحب", "الأخير", "المدينة"
+]
+GENRES = ["درامي", "تشويق", "اكشن", "مغامرة", "كوميدى", "رومانسي"]
+
+class MockOrigin:
+    def __init__(self, series_count=50, episodes=20, latency=0.0, error_rate=0.0,
+                 page_size=30, seed=0):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.page_size = page_size
+        self.random = random.Random(seed)
+        self.catalog = self.generate_catalog(series_count, episodes)
+
+    def generate_catalog(self, series_count, episodes):
+        rng = random.Random(self.random.random())
+        catalog = []
+        for sid in range(1, series_count + 1):
+            catalog.append({
+                "id": sid,
+                "title": " ".join(rng.sample(TITLE_WORDS, 2)) + f" {sid}",
+                "genre": " ، ".join(rng.sample(GENRES, 2)),
+                "year": str(rng.randint(2015, 2025)),
+                "episodes": max(1, episodes + rng.randint(-episodes // 4, episodes // 4)),
+                "qualities": QUALITIES[rng.randint(0, 1):]
+            })
+        return catalog
+
+    def expected_episodes(self):
+        """Map series id -> (episode count, qualities) a complete crawl should produce."""
+        return {str(s["id"]): (s["episodes"], s["qualities"]) for s in self.catalog}
+
+    @web.middleware
+    async def simulate_origin(self, request, handler):
+        if self.latency:
+            await asyncio.sleep(self.latency * self.random.uniform(0.5, 1.5))
+        # Only the crawl pages fail, the category listing has no retry logic to exercise
+        if not request.path.startswith("/category/") and self.random.random() < self.error_rate:
+            raise web.HTTPServiceUnavailable()
+        return await handler(request)
+
+    def make_app(self):
+        app = web.Application(middlewares=[self.simulate_origin])
+        app.router.add_get(CATEGORY_PATH, self.category)
+        app.router.add_get(CATEGORY_PATH + "page/{page}/", self.category)
+        app.router.add_get("/selary/{sid}/", self.series)
+        app.router.add_get("/episode/{sid}/{ep}/watching/", self.watching)
+        return app
+
+    def get_series(self, request):
+        sid = int(request.match_info["sid"])
+        if not 1 <= sid <= len(self.catalog):
+            raise web.HTTPNotFound()
+        return self.catalog[sid - 1]
+
+    async def category(self, request):
+        page = int(request.match_info.get("page", 1))
+        origin = str(request.url.origin())
+        # Newest first, like the real listing
+        listing = self.catalog[::-1][(page - 1) * self.page_size:page * self.page_size]
+        if not listing:
+            raise web.HTTPNotFound()
+
+        articles = []
+        for s in listing:
+            articles.append(
+                f'<article aria-label="post"><a href="{origin}/selary/{s["id"]}/">'
+                f'<img class="lazy" data-src="{origin}/posters/{s["id"]}.jpg" />'
+                f'<ul class="info"><li aria-label="title">{s["title"]} <em>{s["genre"]}</em></li></ul>'
+                f'<ul><li aria-label="ribbon">{s["qualities"][0]}</li>'
+                f'<li aria-label="year">{s["year"]}</li></ul></a></article>'
+            )
+        return web.Response(text=f"<html><body>{''.join(articles)}</body></html>",
+                            content_type="text/html")
+
+    async def series(self, request):
+        s = self.get_series(request)
+        origin = str(request.url.origin())
+        items = "".join(
+            f'<li><a href="{origin}/episode/{s["id"]}/{ep}/"><em>{ep:02d}</em></a></li>'
+            for ep in range(1, s["episodes"] + 1)
+        )
+        html = f'<html><body><ul class="tabcontent active" id="eps">{items}</ul></body></html>'
+        return web.Response(text=html, content_type="text/html")
+
+    async def watching(self, request):
+        s = self.get_series(request)
+        ep = int(request.match_info["ep"])
+        if not 1 <= ep <= s["episodes"]:
+            raise web.HTTPNotFound()
+
+        boxes = []
+        hosts = {"deva": "https://deva-mock.example", "vk": "https://vk.com/mock"}
+        for source, host in hosts.items():
+            links = "".join(
+                f'<a href="{host}/{s["id"]}/{ep:02d}/{quality}.mp4">{quality}\n'
+                f'<p>{300 + ep:.2f} ميجا</p></a>'
+                for quality in s["qualities"]
+            )
+            boxes.append(f'<li aria-label="quality">{links}</li>')
+        html = f'<html><body><ul>{"".join(boxes)}</ul></body></html>'
+        return web.Response(text=html, content_type="text/html")
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a generated cimanow-like catalog locally")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--series", type=int, default=50, help="number of series in the catalog")
+    parser.add_argument("--episodes", type=int, default=20, help="average episodes per series")
+    parser.add_argument("--latency", type=float, default=0.0, help="mean response delay in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of crawl pages answered with 503")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    origin = MockOrigin(args.series, args.episodes, args.latency, args.error_rate, seed=args.seed)
+    web.run_app(origin.make_app(), host=args.host, port=args.port, print=None)
+
+if __name__ == "__main__":
+    main()
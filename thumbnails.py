@@ -0,0 +1,104 @@
+import hashlib
+import io
+import os
+import tempfile
+import time
+import urllib.parse
+import urllib.request
+
+from PIL import Image
+
+# Width in pixels for each named variant, height follows the poster's aspect ratio
+SIZES = {"sm": 180, "md": 360}
+FORMATS = {"webp": ("WEBP", "image/webp"), "jpg": ("JPEG", "image/jpeg")}
+# Seconds a failed poster fetch is remembered before the origin is tried again
+FAILURE_TTL = 10 * 60
+
+def url_key(url):
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
+
+def fetch_url(url, timeout=10):
+    # Poster URLs carry raw Arabic file names, which urllib refuses to send unquoted
+    url = urllib.parse.quote(url, safe=":/?&=%#")
+    req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        return resp.read()
+
+class ThumbnailCache:
+    def __init__(self, cache_dir, fetcher=fetch_url):
+        # fetcher takes a URL and returns the raw image bytes, swap it out to avoid the network
+        self.cache_dir = cache_dir
+        self.fetcher = fetcher
+        self.failures = {}
+
+    def original_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.orig")
+
+    def variant_path(self, key, size, fmt):
+        return os.path.join(self.cache_dir, key[:2], f"{key}-{size}.{fmt}")
+
+    def write_atomic(self, path, data):
+        # The cache is best effort: a read-only or full disk still gets served from memory
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # A unique temp file per write: threads in one worker may render the same variant at once
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def read_cached(self, path):
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def load_original(self, url):
+        path = self.original_path(url_key(url))
+        data = self.read_cached(path)
+        if data is not None:
+            return data
+
+        failed_at = self.failures.get(url)
+        if failed_at is not None and time.time() - failed_at < FAILURE_TTL:
+            raise OSError(f"Fetching {url} failed recently, not retrying yet")
+
+        try:
+            data = self.fetcher(url)
+        except Exception:
+            self.failures[url] = time.time()
+            raise
+        self.failures.pop(url, None)
+        self.write_atomic(path, data)
+        return data
+
+    def get(self, url, size, fmt):
+        """Return the bytes of the resized variant, generating it on first use."""
+        if size not in SIZES or fmt not in FORMATS:
+            raise ValueError(f"Unknown thumbnail variant {size}.{fmt}")
+
+        path = self.variant_path(url_key(url), size, fmt)
+        data = self.read_cached(path)
+        if data is not None:
+            return data
+
+        image = Image.open(io.BytesIO(self.load_original(url)))
+        image = image.convert("RGB")
+        width = SIZES[size]
+        if image.width > width:
+            height = round(image.height * width / image.width)
+            image = image.resize((width, height), Image.LANCZOS)
+
+        out = io.BytesIO()
+        image.save(out, FORMATS[fmt][0], quality=80)
+        self.write_atomic(path, out.getvalue())
+        return out.getvalue()